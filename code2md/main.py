@@ -7,28 +7,58 @@ containing the directory structure and file contents.
 """
 
 import argparse
+import codecs
 import fnmatch
+import os
+import re
+import shutil
 import sys
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path, PurePath
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 import yaml
 
+# Files at least this large are copied into the output straight from disk
+# rather than read into memory first
+LARGE_FILE_SIZE = 1024 * 1024
+
+# Written in place of the contents of files that are not UTF-8 text
+BINARY_PLACEHOLDER = b"[Binary file - content not displayed]"
+
 
 class Code2MD:
     def __init__(self):
-        self.include_files: Optional[List[str]] = None
-        self.exclude_files: Set[str] = set()
-        self.exclude_dirs: Set[str] = set()
-        self.exclude_patterns: List[str] = []
+        self.include_files = None
+        self.exclude_files = frozenset()
+        self.exclude_dirs = set()
+        self.exclude_patterns = []
         self.root_dir: Path = Path.cwd()
         self.output_file: str = "code2md_output.md"
         self.config_path: Path = None
+        self._config_name: Optional[str] = None
         self.tree_only: bool = False
+        self.no_tree: bool = False
+        self.jobs: Optional[int] = None
 
     def load_config(self, config_path: Path) -> Dict[str, Any]:
         """Load configuration from YAML file."""
         self.config_path = config_path
+        self._config_name = Path(config_path).name
         try:
             with open(config_path, "r", encoding="utf-8") as f:
                 config = yaml.safe_load(f) or {}
@@ -44,20 +74,20 @@ class Code2MD:
         if "include_files" in config:
             include_files = config["include_files"]
             if isinstance(include_files, str):
-                self.include_files = [
+                self.include_files = frozenset(
                     f.strip() for f in include_files.split(",") if f.strip()
-                ]
+                )
             elif isinstance(include_files, list):
-                self.include_files = include_files
+                self.include_files = frozenset(include_files)
 
         if "exclude_files" in config:
             exclude_files = config["exclude_files"]
             if isinstance(exclude_files, str):
-                self.exclude_files = set(
+                self.exclude_files = frozenset(
                     f.strip() for f in exclude_files.split(",") if f.strip()
                 )
             elif isinstance(exclude_files, list):
-                self.exclude_files = set(exclude_files)
+                self.exclude_files = frozenset(exclude_files)
 
         if "exclude_dirs" in config:
             exclude_dirs = config["exclude_dirs"]
@@ -83,246 +113,534 @@ class Code2MD:
         if "tree_only" in config:
             self.tree_only = config["tree_only"]
 
-    def should_exclude_dir(self, dir_path: Path) -> bool:
-        """Check if a directory should be excluded."""
+        if "no_tree" in config:
+            self.no_tree = config["no_tree"]
+
+        if "jobs" in config:
+            try:
+                self.jobs = parse_jobs(config["jobs"])
+            except ValueError as e:
+                raise ValueError(f"Invalid 'jobs' in config file: {str(e)}")
+
+    @property
+    def include_files(self) -> Optional[FrozenSet[str]]:
+        """Relative paths of the only files to include, or None to include all."""
+        return self._include_files
+
+    @include_files.setter
+    def include_files(self, files: Optional[Iterable[str]]) -> None:
+        """Set the included files and record every directory leading to them."""
+        if files is None:
+            self._include_files = None
+            self._included_dirs = frozenset()
+            return
+
+        self._include_files = frozenset(self._to_walk_paths(files))
+        included_dirs = set()
+        for file_path in self._include_files:
+            parent = PurePath(file_path).parent
+            while parent != parent.parent:
+                included_dirs.add(parent.as_posix())
+                parent = parent.parent
+        self._included_dirs = frozenset(included_dirs)
+
+    @property
+    def exclude_files(self) -> FrozenSet[str]:
+        """Names or relative paths of files to exclude."""
+        return self._exclude_files
+
+    @exclude_files.setter
+    def exclude_files(self, files: Iterable[str]) -> None:
+        """Set the excluded files."""
+        self._exclude_files = frozenset(self._to_walk_paths(files))
+
+    @property
+    def exclude_dirs(self) -> Set[str]:
+        """Names or relative paths of directories to exclude."""
+        return self._exclude_dirs
+
+    @exclude_dirs.setter
+    def exclude_dirs(self, dirs: Iterable[str]) -> None:
+        """Set the excluded directories."""
+        self._exclude_dirs = set(self._to_walk_paths(dirs))
+
+    @staticmethod
+    def _to_walk_paths(paths: Iterable[str]) -> Iterator[str]:
+        """Return the paths with "/" separators, as used by the walk.
+
+        On Windows, paths such as "src\\config.py" are accepted as well and
+        converted, so they keep matching.
+        """
+        if os.sep == "\\":
+            return (path.replace("\\", "/") for path in paths)
+        return iter(paths)
+
+    @property
+    def exclude_patterns(self) -> Tuple[str, ...]:
+        """Glob patterns matched against the names and relative paths of entries."""
+        return self._exclude_patterns
+
+    @exclude_patterns.setter
+    def exclude_patterns(self, patterns: Sequence[str]) -> None:
+        """Set the exclude patterns and precompile them for the walk.
+
+        All patterns are combined into a single regular expression so each
+        candidate name or path is matched once rather than once per pattern.
+        """
+        self._exclude_patterns = tuple(patterns)
+        self._exclude_re = self._compile_patterns(self._exclude_patterns)
+
+    @staticmethod
+    def _compile_patterns(patterns: Sequence[str]) -> Optional[Pattern[str]]:
+        """Combine glob patterns into one regex, or None if there are none.
+
+        fnmatch.fnmatch applies os.path.normcase to patterns and names, which
+        on Windows makes matching case-insensitive and treats "\\" like "/".
+        The same is done here; the walk's relative paths always use "/".
+        """
+        if not patterns:
+            return None
+        flags = 0
+        if os.path.normcase("A") == "a":
+            patterns = [p.replace("\\", "/") for p in patterns]
+            flags = re.IGNORECASE
+        return re.compile(
+            "|".join(f"(?:{fnmatch.translate(p)})" for p in patterns), flags
+        )
+
+    def should_exclude_dir(self, name: str, relative_path: str) -> bool:
+        """Check if a directory should be excluded.
+
+        relative_path is the "/"-separated path of the directory relative to
+        root_dir, as tracked by the walk. The walk never descends into an
+        excluded directory, so the parent directories are assumed to have
+        passed this check already and are not matched again.
+        """
 
         # Exclude hidden directories
-        if dir_path.name.startswith("."):
+        if name and name[0] == ".":
             return True
 
-        relative_path = str(dir_path.relative_to(self.root_dir))
-
         # Check if directory is in exclude list
-        if relative_path in self.exclude_dirs or dir_path.name in self.exclude_dirs:
+        exclude_dirs = self.exclude_dirs
+        if relative_path in exclude_dirs or name in exclude_dirs:
             return True
 
-        # Check patterns
-        for pattern in self.exclude_patterns:
-            # Check both directory name and relative path
-            if fnmatch.fnmatch(dir_path.name, pattern) or fnmatch.fnmatch(
-                relative_path, pattern
-            ):
-                return True
-
-            # Also check if any parent path matches the pattern
-            if "/" in pattern:
-                path_parts = relative_path.split("/")
-                for i in range(len(path_parts)):
-                    partial_path = "/".join(path_parts[: i + 1])
-                    if fnmatch.fnmatch(partial_path, pattern):
-                        return True
+        # Check patterns against both directory name and relative path
+        exclude_re = self._exclude_re
+        if exclude_re is not None and (
+            exclude_re.match(name) or exclude_re.match(relative_path)
+        ):
+            return True
 
         return False
 
-    def should_exclude_file(self, file_path: Path) -> bool:
-        """Check if a file should be excluded based on various criteria."""
+    def should_exclude_file(self, name: str, rel_path_str: str) -> bool:
+        """Check if a file should be excluded based on various criteria.
+
+        rel_path_str is the "/"-separated path of the file relative to
+        root_dir, as tracked by the walk.
+        """
 
         # Exclude hidden files
-        if file_path.name.startswith("."):
+        if name and name[0] == ".":
             return True
 
         # Always exclude the output filename
-        if file_path.name == self.output_file:
+        if name == self.output_file:
             return True
 
         # Always exclude config file
-        if file_path.name == Path(self.config_path).name:
+        if name == self._config_name:
             return True
 
-        rel_path_str = str(file_path.relative_to(self.root_dir))
-
         # Check if file is in exclude list
         if rel_path_str in self.exclude_files:
             return True
 
         # Check if file matches exclude patterns
-        for pattern in self.exclude_patterns:
-            if fnmatch.fnmatch(file_path.name, pattern):
-                return True
-
-            if fnmatch.fnmatch(rel_path_str, pattern):
-                return True
-
-            if "/" in pattern:
-                if fnmatch.fnmatch(rel_path_str, pattern):
-                    return True
+        exclude_re = self._exclude_re
+        if exclude_re is not None and (
+            exclude_re.match(name) or exclude_re.match(rel_path_str)
+        ):
+            return True
 
         # If include_files is specified, only include those files
-        if self.include_files is not None:
-            return rel_path_str not in self.include_files
+        include_files = self.include_files
+        if include_files is not None:
+            return rel_path_str not in include_files
 
         return False
 
-    def is_directory_needed_for_included_files(self, dir_path: Path) -> bool:
-        """Check if a directory is needed to show path to included files."""
+    def is_directory_needed_for_included_files(self, relative_dir_path: str) -> bool:
+        """Check if a directory is needed to show path to included files.
+
+        relative_dir_path is the "/"-separated path of the directory relative
+        to root_dir, or "" for root_dir itself. The parent directories of the
+        included files are worked out once when include_files is set, so this
+        is a single set lookup.
+        """
         if self.include_files is None:
             return True
 
+        return relative_dir_path == "" or relative_dir_path in self._included_dirs
+
+    def scan_dir(
+        self, path: str, relative_dir_path: str
+    ) -> List[Tuple[str, str, str, bool, bool]]:
+        """List the sorted entries of a directory that belong in the tree.
+
+        Returns (name, path, relative_path, is_dir, is_file) tuples, with the
+        relative path built from relative_dir_path rather than recomputed
+        from root_dir. The file type of each entry comes from os.scandir, so
+        no extra stat() is issued per entry; only symlinks are resolved, to
+        find those that point to directories. Those sort with the
+        directories, but name is their tree label from describe_dir_symlink
+        and is_dir is False, so the walk does not follow them.
+        """
+        rel_prefix = relative_dir_path + "/" if relative_dir_path else ""
+
+        # The filters run for every entry, so look them up once per directory
+        # rather than on each iteration
+        should_exclude_dir = self.should_exclude_dir
+        should_exclude_file = self.should_exclude_file
+        is_directory_needed = (
+            None
+            if self.include_files is None
+            else self.is_directory_needed_for_included_files
+        )
+
+        # Entries are filtered while the directory is read, so excluded ones
+        # never reach the sort. Each kept entry is keyed for sorting
+        # directories first by casefolded name, with the exact name as a
+        # tie-break so the entry tuples themselves are never compared.
+        keyed_entries = []
+        append = keyed_entries.append
+        # As with os.walk, a directory that cannot be listed, because it is
+        # unreadable or was removed mid-walk, is skipped. Errors about single
+        # entries are handled per entry, in entry_types.
         try:
-            relative_dir_path = str(dir_path.relative_to(self.root_dir))
-        except ValueError:
-            # Path is not relative to root_dir
-            return False
-
-        # Check if any included file is within this directory or its subdirectories
-        for file_path in self.include_files:
-            # Convert included file path to Path object for proper comparison
-            included_file_path = Path(file_path)
-
-            # Get all parent directories of the included file
-            file_parents = []
-            current_parent = included_file_path.parent
-            while str(current_parent) != ".":
-                file_parents.append(str(current_parent))
-                current_parent = current_parent.parent
-
-            # Check if this directory is the root directory and file has parents
-            if relative_dir_path == "" and (file_parents or "/" not in file_path):
-                return True
-
-            # Check if this directory matches any parent directory of the included file
-            if relative_dir_path in file_parents:
-                return True
-
-            # Check if this directory exactly matches the file's direct parent
-            if (
-                relative_dir_path == str(included_file_path.parent)
-                and str(included_file_path.parent) != "."
-            ):
-                return True
-
-        return False
-
-    def generate_tree_structure(
-        self, path: Path, prefix: str = "", is_last: bool = True
-    ) -> str:
-        """Generate a tree-like directory structure string."""
-        # Check exclusion first for non-root directories
-        if path != self.root_dir:
-            if path.is_dir():
-                if self.include_files is not None:
-                    if not self.is_directory_needed_for_included_files(path):
-                        return ""
-                elif self.should_exclude_dir(path):
-                    return ""
-
-        # Generate the current item's tree representation
-        if path == self.root_dir:
-            tree_str = f"{path.name}/\n"
-        else:
-            connector = "└── " if is_last else "├── "
-            tree_str = f"{prefix}{connector}{path.name}{'/' if path.is_dir() else ''}\n"
-
-        # Process directory contents
-        if path.is_dir():
-            try:
-                all_entries = sorted(
-                    path.iterdir(), key=lambda x: (x.is_file(), x.name.lower())
-                )
-
-                entries = []
-                # Filter entries
-                for entry in all_entries:
-                    if entry.is_dir():
-                        # Check if directory is needed when include_files is specified
-                        if self.include_files is not None:
-                            if self.is_directory_needed_for_included_files(entry):
-                                entries.append(entry)
-                        elif not self.should_exclude_dir(entry):
-                            entries.append(entry)
-                    else:
-                        if not self.should_exclude_file(entry):
-                            entries.append(entry)
-
-                # Generate tree for filtered entries
-                for i, entry in enumerate(entries):
-                    is_last_entry = i == len(entries) - 1
-
-                    if path == self.root_dir:
-                        new_prefix = ""
-                    else:
-                        new_prefix = prefix + ("    " if is_last else "│   ")
-
-                    subtree = self.generate_tree_structure(
-                        entry, new_prefix, is_last_entry
+            it = os.scandir(path)
+        except OSError:
+            return []
+        with it:
+            while True:
+                try:
+                    entry = next(it)
+                except StopIteration:
+                    break
+                except OSError:
+                    return []
+
+                name = entry.name
+                # Hidden entries are skipped before their relative path is
+                # even built
+                if name[0] == ".":
+                    continue
+
+                rel_path = rel_prefix + name
+                is_dir, is_dir_link, is_file = self.entry_types(entry)
+                if is_dir or is_dir_link:
+                    # Excluded directories are never descended into. When
+                    # include_files is specified, only directories leading
+                    # to included files are kept. Symlinked directories
+                    # are listed with the other directories and labelled
+                    # with their target, but are never followed.
+                    if not should_exclude_dir(name, rel_path) and (
+                        is_directory_needed is None or is_directory_needed(rel_path)
+                    ):
+                        label = name if is_dir else self.describe_dir_symlink(entry)
+                        append(
+                            (
+                                False,
+                                name.casefold(),
+                                name,
+                                (label, entry.path, rel_path, is_dir, False),
+                            )
+                        )
+                elif not should_exclude_file(name, rel_path):
+                    append(
+                        (
+                            True,
+                            name.casefold(),
+                            name,
+                            (name, entry.path, rel_path, False, is_file),
+                        )
                     )
-                    tree_str += subtree
 
-            except PermissionError:
-                pass
+        keyed_entries.sort()
+        return [keyed[-1] for keyed in keyed_entries]
 
-        return tree_str
+    @staticmethod
+    def entry_types(entry: os.DirEntry) -> Tuple[bool, bool, bool]:
+        """Return (is_dir, is_dir_symlink, is_file) for a directory entry.
 
-    def collect_files(self, path: Path) -> List[Path]:
-        """Recursively collect all files that should be included."""
+        Only symlinks are followed, to tell links to directories and regular
+        files apart. As in os.walk, an entry whose type cannot be determined,
+        such as a symlink loop, counts as neither a directory nor a file.
+        """
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                return True, False, False
+        except OSError:
+            pass
+        try:
+            if entry.is_symlink() and entry.is_dir():
+                return False, True, False
+        except OSError:
+            pass
+        try:
+            return False, False, entry.is_file()
+        except OSError:
+            return False, False, False
+
+    @staticmethod
+    def describe_dir_symlink(entry: os.DirEntry) -> str:
+        """Tree label for a symlink to a directory, e.g. "name -> target/"."""
+        try:
+            return f"{entry.name} -> {os.readlink(entry.path)}/"
+        except OSError:
+            return f"{entry.name}/"
+
+    def walk(self) -> Tuple[str, List[Tuple[str, str]]]:
+        """Walk the directory once, building the tree and the files to include.
+
+        Returns the tree-like directory structure string and the
+        (path, relative_path) string pairs of the files whose contents should
+        be written, in tree order. Paths are kept as the strings returned by
+        os.scandir rather than converted to Path objects. The tree string is
+        empty when no_tree is set, and the file list is empty when tree_only
+        is set, as neither is needed then.
+        """
+        root = self.root_dir
+        emit_tree = not self.no_tree
+        collect_files = not self.tree_only
+        tree_lines = [f"{root.name}/\n"] if emit_tree else []
         files = []
 
-        if path.is_file():
-            if not self.should_exclude_file(path):
-                files.append(path)
-        elif path.is_dir():
-            if not self.should_exclude_dir(path):
-                try:
-                    for entry in sorted(path.iterdir(), key=lambda x: x.name.lower()):
-                        files.extend(self.collect_files(entry))
-                except PermissionError:
-                    pass
+        # Bound methods used once per entry are looked up once up front
+        scan_dir = self.scan_dir
+        add_line = tree_lines.append
+        add_file = files.append
+
+        with ThreadPoolExecutor(max_workers=self.worker_count()) as executor:
+            submit = executor.submit
+
+            def scan(path, rel_path):
+                # Scan a directory and immediately queue scans of its kept
+                # subdirectories, keyed by their index among its entries, so
+                # the pool works ahead of the tree being built below
+                entries = scan_dir(path, rel_path)
+                subdirs = {
+                    i: submit(scan, entry[1], entry[2])
+                    for i, entry in enumerate(entries)
+                    if entry[3]
+                }
+                return entries, subdirs
+
+            # The walk keeps an explicit stack of directory frames rather than
+            # recursing, so deep trees cannot hit the recursion limit. Each
+            # frame is (children, last_index, prefix, subdirs), where children
+            # iterates over the directory's remaining (index, entry) pairs one
+            # at a time and subdirs holds the pending scans of its
+            # subdirectories. Excluded directories are already dropped by
+            # scan_dir, so every directory pushed here belongs in the output.
+            # Directories are scanned in parallel, but the tree is always
+            # built in sorted order.
+            entries, subdirs = scan(str(root), "")
+            stack = [(enumerate(entries), len(entries) - 1, "", subdirs)]
+            while stack:
+                children, last_index, prefix, subdirs = stack[-1]
+                child = next(children, None)
+                if child is None:
+                    stack.pop()
+                    continue
+
+                i, (name, path, rel_path, is_dir, is_file) = child
+                if emit_tree:
+                    is_last = i == last_index
+                    connector = "└── " if is_last else "├── "
+                    add_line(f"{prefix}{connector}{name}{'/' if is_dir else ''}\n")
+
+                if is_dir:
+                    entries, grandchildren = subdirs.pop(i).result()
+                    child_prefix = (
+                        prefix + ("    " if is_last else "│   ") if emit_tree else ""
+                    )
+                    stack.append(
+                        (
+                            enumerate(entries),
+                            len(entries) - 1,
+                            child_prefix,
+                            grandchildren,
+                        )
+                    )
+                elif is_file and collect_files:
+                    add_file((path, rel_path))
+
+        return "".join(tree_lines), files
+
+    def worker_count(self) -> int:
+        """Number of threads used to scan directories and read files."""
+        if self.jobs is not None:
+            return self.jobs
+        return min(32, (os.cpu_count() or 1) * 4)
+
+    @staticmethod
+    def _looks_binary(head: bytes) -> bool:
+        """Check the start of a file for a NUL byte, a cheap sign of binary data."""
+        return b"\x00" in head[:8192]
+
+    @staticmethod
+    def _read_failure(error: Exception) -> bytes:
+        """Return what is written in place of a file that could not be read."""
+        if isinstance(error, UnicodeDecodeError):
+            # If it's a binary file, indicate that
+            return BINARY_PLACEHOLDER
+        return f"[Error reading file: {str(error)}]".encode("utf-8")
 
-        return files
+    def read_file_content(self, file_path: str) -> bytes:
+        """Read file content, handling binary files gracefully.
 
-    def read_file_content(self, file_path: Path) -> str:
-        """Read file content, handling binary files gracefully."""
+        The raw bytes are returned so they can be written to the output
+        unchanged; decoding is only used to check that they are UTF-8 text.
+        """
         try:
-            # Try to read as text first
-            with open(file_path, "r", encoding="utf-8") as f:
+            with open(file_path, "rb") as f:
                 content = f.read()
+            if self._looks_binary(content):
+                return BINARY_PLACEHOLDER
+            # ASCII is always valid UTF-8, and checking for it is much cheaper
+            # than decoding the whole file into a str that is thrown away
+            if not content.isascii():
+                content.decode("utf-8")
             return content
-        except UnicodeDecodeError:
-            # If it's a binary file, indicate that
-            return "[Binary file - content not displayed]"
         except Exception as e:
-            return f"[Error reading file: {str(e)}]"
+            return self._read_failure(e)
 
-    def generate_markdown(self) -> str:
-        """Generate the complete markdown output."""
-        # Generate tree structure
-        tree_structure = self.generate_tree_structure(self.root_dir)
+    def load_file_content(self, file_path: str) -> Optional[bytes]:
+        """Load file content for the output, or None to copy the file from disk.
 
-        # Start building markdown
-        markdown_content = "Following is a directory tree"
-        if not self.tree_only:
-            markdown_content += " and file contents"
-        markdown_content += ".\n\n"
+        Small files are read with read_file_content. Large files are only
+        checked to be UTF-8 text, in chunks, and None is returned so that
+        copy_file_content can later copy them without holding them in memory.
+        """
+        try:
+            size = os.stat(file_path).st_size
+        except OSError:
+            # Let read_file_content report the error
+            size = 0
+        if size < LARGE_FILE_SIZE:
+            return self.read_file_content(file_path)
 
-        markdown_content += "```\n"
-        markdown_content += tree_structure
-        markdown_content += "```\n\n"
+        try:
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            with open(file_path, "rb") as f:
+                chunk = f.read(65536)
+                if self._looks_binary(chunk):
+                    return BINARY_PLACEHOLDER
+                while chunk:
+                    decoder.decode(chunk)
+                    chunk = f.read(65536)
+            decoder.decode(b"", final=True)
+        except Exception as e:
+            return self._read_failure(e)
+        return None
 
-        # Add file contents only if not tree-only mode
-        if not self.tree_only:
-            # Collect all files
-            all_files = self.collect_files(self.root_dir)
+    def copy_file_content(self, fp: BinaryIO, file_path: str) -> None:
+        """Copy a file's content into the output without reading it into memory.
 
-            for file_path in all_files:
-                relative_path = file_path.relative_to(self.root_dir)
-                content = self.read_file_content(file_path)
+        On Linux the copy is done by os.sendfile inside the kernel; elsewhere,
+        or if sendfile fails, shutil.copyfileobj copies it in chunks.
+        """
+        try:
+            src = open(file_path, "rb")
+        except Exception as e:
+            fp.write(self._read_failure(e))
+            return
 
-                markdown_content += f"{relative_path}\n"
-                markdown_content += "```\n"
-                markdown_content += content
-                markdown_content += "\n```\n\n"
+        with src:
+            offset = 0
+            if sys.platform.startswith("linux") and hasattr(os, "sendfile"):
+                try:
+                    out_fd = fp.fileno()
+                    # Anything still buffered must reach the file first
+                    fp.flush()
+                    size = os.fstat(src.fileno()).st_size
+                    while offset < size:
+                        sent = os.sendfile(out_fd, src.fileno(), offset, size - offset)
+                        if sent == 0:
+                            break
+                        offset += sent
+                    return
+                except (OSError, ValueError, AttributeError):
+                    # Not a real file descriptor, or sendfile is unsupported
+                    src.seek(offset)
+            shutil.copyfileobj(src, fp)
+
+    def write_markdown(
+        self,
+        fp: BinaryIO,
+        tree_structure: str,
+        all_files: Sequence[Tuple[str, str]],
+    ) -> None:
+        """Write the complete markdown output to a binary file object.
+
+        The output is streamed piece by piece rather than built up as one
+        string, so only one file's contents is held in memory at a time.
+        """
+        if self.no_tree:
+            fp.write(b"Following are the file contents.\n\n")
+        else:
+            header = "Following is a directory tree"
+            if not self.tree_only:
+                header += " and file contents"
+            fp.write(f"{header}.\n\n```\n{tree_structure}```\n\n".encode("utf-8"))
 
-        return markdown_content
+        # Add file contents only if not tree-only mode
+        if not self.tree_only:
+            jobs = self.worker_count()
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                # Files are read ahead on the pool while earlier ones are
+                # written, keeping a bounded number of reads in flight so
+                # memory use does not grow with the size of the tree
+                pending = deque()
+                for file_path, relative_path in all_files:
+                    future = executor.submit(self.load_file_content, file_path)
+                    pending.append((file_path, relative_path, future))
+                    if len(pending) >= 2 * jobs:
+                        self.write_file_block(fp, *pending.popleft())
+                while pending:
+                    self.write_file_block(fp, *pending.popleft())
+
+    def write_file_block(
+        self,
+        fp: BinaryIO,
+        file_path: str,
+        relative_path: str,
+        content: "Future[Optional[bytes]]",
+    ) -> None:
+        """Write one file's heading and code block once its content is loaded."""
+        fp.write(f"{relative_path}\n```\n".encode("utf-8"))
+        data = content.result()
+        if data is None:
+            self.copy_file_content(fp, file_path)
+        else:
+            fp.write(data)
+        fp.write(b"\n```\n\n")
 
     def run(self) -> None:
         """Execute the code2md conversion."""
         try:
-            markdown_content = self.generate_markdown()
+            # Walk the directory once for both the tree and the files to
+            # include. This is done before the output file is created, so the
+            # walk never picks up the file being written.
+            tree_structure, all_files = self.walk()
 
-            # Write output file
+            # Stream the markdown straight into the output file
             output_path = self.root_dir / self.output_file
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(markdown_content)
+            with open(output_path, "wb") as f:
+                self.write_markdown(f, tree_structure, all_files)
 
             print(f"Successfully generated {output_path}")
 
@@ -338,6 +656,30 @@ def parse_list_argument(value: str) -> List[str]:
     return [item.strip() for item in value.split(",") if item.strip()]
 
 
+def parse_jobs(value: Any) -> int:
+    """Parse the number of parallel jobs, which must be a positive integer.
+
+    The value is parsed from its string form, so a config file value such as
+    4 or "4" is accepted exactly when the same text would be on the command
+    line. Raises ValueError otherwise.
+    """
+    try:
+        jobs = int(str(value))
+    except ValueError:
+        jobs = 0
+    if jobs < 1:
+        raise ValueError(f"must be a positive integer: '{value}'")
+    return jobs
+
+
+def parse_jobs_argument(value: str) -> int:
+    """Parse the --jobs argument."""
+    try:
+        return parse_jobs(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
 def main():
     """Main entry point for the command line tool."""
     parser = argparse.ArgumentParser(
@@ -349,15 +691,18 @@ Examples:
   code2md /path/to/project                   # Process specific directory
   code2md --config config.yaml              # Use YAML config file
   code2md --tree-only                       # Generate only directory tree
+  code2md --no-tree                         # Generate only file contents
   code2md --include-files "main.py,utils.py" # Include only specific files
   code2md --exclude-files "config.py"       # Exclude specific files
   code2md --exclude-dirs "__pycache__,.git" # Exclude directories
   code2md --exclude-patterns "*.log,*_test_*" # Exclude file patterns
   code2md --output my_project.md             # Custom output filename
+  code2md --jobs 8                           # Scan and read with 8 threads
 
 Config file format (YAML):
   directory: "/path/to/project"              # Optional: directory to process
   tree_only: true                            # Optional: generate only tree structure
+  no_tree: false                             # Optional: generate only file contents
   include_files:                             # Optional: files to include (list or comma-separated string)
     - "main.py"
     - "utils.py"
@@ -370,6 +715,7 @@ Config file format (YAML):
     - "*.log"
     - "*_test_*"
   output: "my_project.md"                    # Optional: output filename
+  jobs: 8                                    # Optional: number of scanning and reading threads (positive integer)
         """,
     )
 
@@ -413,18 +759,33 @@ Config file format (YAML):
         help='Comma-separated list of file patterns to exclude (e.g., "*.log,*_test_*")',
     )
 
-    parser.add_argument(
+    tree_group = parser.add_mutually_exclusive_group()
+
+    tree_group.add_argument(
         "--tree-only",
         action="store_true",
         help="Generate only the directory tree structure (no file contents)",
     )
 
+    tree_group.add_argument(
+        "--no-tree",
+        action="store_true",
+        help="Generate only the file contents (no directory tree structure)",
+    )
+
     parser.add_argument(
         "--output",
         default="code2md_output.md",
         help="Output filename (default: code2md_output.md)",
     )
 
+    parser.add_argument(
+        "--jobs",
+        type=parse_jobs_argument,
+        help="Number of threads used to scan directories and read files, "
+        "a positive integer (default: based on CPU count)",
+    )
+
     args = parser.parse_args()
 
     # Initialize code2md instance
@@ -455,17 +816,23 @@ Config file format (YAML):
         code2md.root_dir = Path(args.directory).resolve()
 
     if args.include_files is not None:
-        code2md.include_files = args.include_files
+        code2md.include_files = frozenset(args.include_files)
     if args.exclude_files:
-        code2md.exclude_files.update(args.exclude_files)
+        code2md.exclude_files = code2md.exclude_files.union(args.exclude_files)
     if args.exclude_dirs:
-        code2md.exclude_dirs.update(args.exclude_dirs)
+        code2md.exclude_dirs = code2md.exclude_dirs.union(args.exclude_dirs)
     if args.exclude_patterns:
-        code2md.exclude_patterns.extend(args.exclude_patterns)
+        code2md.exclude_patterns = [*code2md.exclude_patterns, *args.exclude_patterns]
     if args.output != "code2md_output.md":
         code2md.output_file = args.output
     if args.tree_only:
         code2md.tree_only = True
+        code2md.no_tree = False
+    if args.no_tree:
+        code2md.no_tree = True
+        code2md.tree_only = False
+    if args.jobs is not None:
+        code2md.jobs = args.jobs
 
     # Validate directory
     if not code2md.root_dir.exists():
@@ -476,6 +843,10 @@ Config file format (YAML):
         print(f"Error: '{args.directory}' is not a directory", file=sys.stderr)
         return 1
 
+    if code2md.tree_only and code2md.no_tree:
+        print("Error: tree_only and no_tree cannot both be set", file=sys.stderr)
+        return 1
+
     # Run the conversion
     return code2md.run()
 